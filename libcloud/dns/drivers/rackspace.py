@@ -55,7 +55,7 @@ class RackspaceDNSResponse(OpenStack_1_1_Response):
                 raise RecordDoesNotExistError(value='', driver=self,
                                               record_id=context['id'])
         if body:
-            if 'code' and 'message' in body:
+            if 'code' in body and 'message' in body:
                 err = '%s - %s (%s)' % (body['code'], body['message'],
                                         body['details'])
                 return err
@@ -95,7 +95,7 @@ class RackspaceDNSConnection(OpenStack_1_1_Connection, PollingConnection):
         if status == 'ERROR':
             data = response.object['error']
 
-            if 'code' and 'message' in data:
+            if 'code' in data and 'message' in data:
                 message = '%s - %s (%s)' % (data['code'], data['message'],
                                             data['details'])
             else:
@@ -409,7 +409,9 @@ class RackspaceDNSDriver(DNSDriver, OpenStackDriverMixin):
             return None
 
         # Strip domain portion
-        name = name.replace('.%s' % (domain), '')
+        suffix = '.%s' % (domain)
+        if name.endswith(suffix):
+            name = name[:-len(suffix)]
         return name
 
     def _ex_connection_class_kwargs(self):
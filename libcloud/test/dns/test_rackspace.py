@@ -206,6 +206,19 @@ class RackspaceUSTests(unittest.TestCase):
         else:
             self.fail('Exception was not thrown')
 
+    def test_create_zone_job_error_without_code(self):
+        RackspaceMockHttp.type = 'CREATE_ZONE_JOB_ERROR'
+
+        try:
+            self.driver.create_zone(domain='foo.bar.com', type='master',
+                                    ttl=None,
+                                    extra={'email': 'test@test.com'})
+        except LibcloudError:
+            e = sys.exc_info()[1]
+            self.assertEqual(e.value, 'Domain already exists')
+        else:
+            self.fail('Exception was not thrown')
+
     def test_update_zone_success(self):
         zone = self.driver.list_zones()[0]
         updated_zone = self.driver.update_zone(zone=zone,
@@ -312,8 +325,10 @@ class RackspaceUSTests(unittest.TestCase):
     def test_to_partial_record_name(self):
         domain = 'example.com'
         names = ['test.example.com', 'foo.bar.example.com',
-                 'example.com.example.com', 'example.com']
-        expected_values = ['test', 'foo.bar', 'example.com', None]
+                 'example.com.example.com', 'example.com',
+                 'a.example.com.b.example.com']
+        expected_values = ['test', 'foo.bar', 'example.com', None,
+                           'a.example.com.b']
 
         for name, expected_value in zip(names, expected_values):
             value = self.driver._to_partial_record_name(domain=domain,
@@ -429,6 +444,18 @@ class RackspaceMockHttp(MockHttp):
         return (httplib.OK, body, self.base_headers,
                 httplib.responses[httplib.OK])
 
+    def _v1_0_11111_domains_CREATE_ZONE_JOB_ERROR(self, method, url, body,
+                                                  headers):
+        body = self.fixtures.load('create_zone_success.json')
+        return (httplib.OK, body, self.base_headers,
+                httplib.responses[httplib.OK])
+
+    def _v1_0_11111_status_288795f9_e74d_48be_880b_a9e36e0de61e_CREATE_ZONE_JOB_ERROR(self, method, url, body, headers):
+        # Async status - create_zone job failed
+        body = self.fixtures.load('create_zone_job_error.json')
+        return (httplib.OK, body, self.base_headers,
+                httplib.responses[httplib.OK])
+
     def _v1_0_11111_domains_CREATE_ZONE_VALIDATION_ERROR(self, method, url, body, headers):
         body = self.fixtures.load('create_zone_validation_error.json')
         return (httplib.BAD_REQUEST, body, self.base_headers,